@@ -13,13 +13,38 @@ Example:
     values = [100, 200, 300, 1000, 2000]
     result = lawkit.law("pareto", values)
     print(result)
+
+    # Leading digits for Benford-style pre-processing
+    digits = lawkit.first_digits([123, 0.045, -9876])  # [1, 4, 9]
+
+    # Parse options once and reuse them across calls
+    options = lawkit.Options(risk_threshold="high")
+    result = lawkit.law("benf", data, options=options)
 """
 
+import math
+
 from ._lawkit import (
+    Options,
+    first_digits,
     law,
+    law_batch,
+    law_chunked,
+    law_from_file,
+    law_from_string,
 )
 
+# Theoretical Benford first-digit probabilities for digits 1-9, computed once at import
+BENFORD_PMF = tuple(math.log10(1 + 1 / d) for d in range(1, 10))
+
 __all__ = [
+    "BENFORD_PMF",
+    "Options",
+    "first_digits",
     "law",
+    "law_batch",
+    "law_chunked",
+    "law_from_file",
+    "law_from_string",
 ]
 __version__ = "2.6.0"
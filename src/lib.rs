@@ -1,33 +1,173 @@
 #![allow(clippy::useless_conversion)]
 
 use lawkit_core::{law, LawkitOptions, LawkitResult, LawkitSpecificOptions};
+use pyo3::buffer::{Element, PyBuffer, ReadOnlyCell};
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict};
 use serde_json::Value;
+use std::collections::HashMap;
+use std::fs::File;
+use std::io::{BufRead, BufReader};
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock, PoisonError};
+
+/// Maximum number of compiled `ignore_keys_regex` patterns kept in memory
+const REGEX_CACHE_CAPACITY: usize = 32;
+
+/// Maximum number of seeded `generate` results kept in memory
+const GENERATE_CACHE_CAPACITY: usize = 16;
+
+/// Maximum total number of generated samples kept in memory by the `generate`
+/// cache; larger requests are not cached at all
+const GENERATE_CACHE_MAX_SAMPLES: usize = 1_000_000;
+
+/// Convert f64 to serde_json::Value (NaN and infinities become null)
+fn f64_to_value(f: f64) -> Value {
+    serde_json::Number::from_f64(f)
+        .map(Value::Number)
+        .unwrap_or(Value::Null)
+}
+
+/// Whether the object is a builtin type that never exports a numeric buffer
+fn skips_buffer_path(obj: &Bound<'_, PyAny>) -> bool {
+    obj.is_none()
+        || obj.is_instance_of::<pyo3::types::PyLong>()
+        || obj.is_instance_of::<pyo3::types::PyFloat>()
+        || obj.is_instance_of::<pyo3::types::PyString>()
+        || obj.is_instance_of::<pyo3::types::PyBytes>()
+        || obj.is_instance_of::<pyo3::types::PyByteArray>()
+        || obj.is_instance_of::<pyo3::types::PyList>()
+        || obj.is_instance_of::<pyo3::types::PyTuple>()
+        || obj.is_instance_of::<pyo3::types::PyDict>()
+}
+
+/// Read a buffer of element type `T` into serde_json::Value
+///
+/// Returns `None` when the object does not export a buffer of that element type.
+fn numeric_buffer<T: Element + Copy>(
+    py: Python,
+    obj: &Bound<'_, PyAny>,
+    to_value: impl Fn(T) -> Value,
+) -> PyResult<Option<Value>> {
+    let Ok(buffer) = PyBuffer::<T>::get_bound(obj) else {
+        return Ok(None);
+    };
+    let values: Vec<Value> = match buffer.as_slice(py) {
+        // C-contiguous buffers are read in place, without an intermediate Vec<T> copy
+        Some(cells) => cells.iter().map(|cell| to_value(cell.get())).collect(),
+        None => buffer.to_vec(py)?.into_iter().map(&to_value).collect(),
+    };
+    if buffer.dimensions() == 0 {
+        return Ok(values.into_iter().next());
+    }
+    Ok(Some(nest_values(values, buffer.shape())))
+}
+
+/// Nest C-ordered values into arrays following `shape`, like ndarray.tolist()
+fn nest_values(values: Vec<Value>, shape: &[usize]) -> Value {
+    if shape.len() <= 1 {
+        return Value::Array(values);
+    }
+
+    let row_len: usize = shape[1..].iter().product();
+    let mut values = values.into_iter();
+    Value::Array(
+        (0..shape[0])
+            .map(|_| nest_values(values.by_ref().take(row_len).collect(), &shape[1..]))
+            .collect(),
+    )
+}
+
+/// Convert a buffer-protocol object (NumPy array, array.array, memoryview) to serde_json::Value
+///
+/// Reads the numbers straight out of the exported buffer instead of
+/// extracting one Python object per element.
+/// Returns `None` when the object does not export a buffer or exports an
+/// unsupported 0-dim (scalar) buffer, and raises `TypeError` for arrays whose
+/// element format or alignment can't be read (e.g. float16 or bool), rather
+/// than analyzing the object's `str()`.
+fn buffer_to_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Option<Value>> {
+    if let Some(value) = numeric_buffer::<f64>(py, obj, f64_to_value)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<f32>(py, obj, |f| f64_to_value(f64::from(f)))? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<i64>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<i32>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<i16>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<i8>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<u64>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<u32>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<u16>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+    if let Some(value) = numeric_buffer::<u8>(py, obj, Value::from)? {
+        return Ok(Some(value));
+    }
+
+    let Ok(view) = pyo3::types::PyMemoryView::from_bound(obj) else {
+        return Ok(None);
+    };
+    // 0-dim buffers are scalars such as np.bool_ or np.float16; leave those
+    // to the scalar extraction in python_to_value()
+    if view.getattr(intern!(py, "ndim"))?.extract::<usize>()? == 0 {
+        return Ok(None);
+    }
+    let format = view.getattr(intern!(py, "format"))?;
+    Err(pyo3::exceptions::PyTypeError::new_err(format!(
+        "Unsupported buffer format {format} or layout; \
+         convert to an aligned integer or float32/float64 array"
+    )))
+}
 
 /// Convert Python object to serde_json::Value
 fn python_to_value(_py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    if !skips_buffer_path(obj) {
+        if let Some(value) = buffer_to_value(_py, obj)? {
+            return Ok(value);
+        }
+    }
+
     if obj.is_none() {
         Ok(Value::Null)
     } else if let Ok(b) = obj.extract::<bool>() {
         Ok(Value::Bool(b))
     } else if let Ok(i) = obj.extract::<i64>() {
         Ok(Value::Number(serde_json::Number::from(i)))
+    } else if let Ok(u) = obj.extract::<u64>() {
+        Ok(Value::Number(serde_json::Number::from(u)))
     } else if let Ok(f) = obj.extract::<f64>() {
-        if let Some(n) = serde_json::Number::from_f64(f) {
-            Ok(Value::Number(n))
-        } else {
-            Ok(Value::Null)
-        }
+        Ok(f64_to_value(f))
     } else if let Ok(s) = obj.extract::<String>() {
         Ok(Value::String(s))
     } else if obj.is_instance_of::<pyo3::types::PyList>() {
         let list = obj.downcast::<pyo3::types::PyList>()?;
-        let mut vec = Vec::new();
+        let mut vec = Vec::with_capacity(list.len());
         for item in list.iter() {
             vec.push(python_to_value(_py, &item)?);
         }
         Ok(Value::Array(vec))
+    } else if obj.is_instance_of::<pyo3::types::PyTuple>() {
+        let tuple = obj.downcast::<pyo3::types::PyTuple>()?;
+        let mut vec = Vec::with_capacity(tuple.len());
+        for item in tuple.iter() {
+            vec.push(python_to_value(_py, &item)?);
+        }
+        Ok(Value::Array(vec))
     } else if obj.is_instance_of::<pyo3::types::PyDict>() {
         let dict = obj.downcast::<pyo3::types::PyDict>()?;
         let mut map = serde_json::Map::new();
@@ -36,12 +176,48 @@ fn python_to_value(_py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
             map.insert(key_str, python_to_value(_py, &value)?);
         }
         Ok(Value::Object(map))
+    } else if let Ok(mapping) = obj.downcast::<pyo3::types::PyMapping>() {
+        // Other mappings, e.g. read-only types.MappingProxyType configs
+        let mut map = serde_json::Map::new();
+        for item in mapping.items()?.iter() {
+            let (key, value): (String, Bound<'_, PyAny>) = item.extract()?;
+            map.insert(key, python_to_value(_py, &value)?);
+        }
+        Ok(Value::Object(map))
     } else {
         // Try to convert to string as fallback
         Ok(Value::String(obj.str()?.extract::<String>()?))
     }
 }
 
+/// Concatenate nested arrays into one flat array, in C order
+fn flatten_into(value: Value, out: &mut Vec<Value>) {
+    match value {
+        Value::Array(items) => items.into_iter().for_each(|item| flatten_into(item, out)),
+        other => out.push(other),
+    }
+}
+
+/// Convert analysis input, treating a multi-dimensional buffer as one dataset
+///
+/// A `(N, 1)` column such as `df[["amount"]].to_numpy()` is analyzed as its
+/// N values; per-row analysis is opt-in via `law(..., rows=True)`.
+fn data_to_value(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    let value = python_to_value(py, obj)?;
+    match value {
+        Value::Array(items)
+            if !skips_buffer_path(obj) && items.first().is_some_and(Value::is_array) =>
+        {
+            let mut flat = Vec::new();
+            items
+                .into_iter()
+                .for_each(|item| flatten_into(item, &mut flat));
+            Ok(Value::Array(flat))
+        }
+        other => Ok(other),
+    }
+}
+
 /// Convert serde_json::Value to Python object
 #[allow(dead_code)]
 fn value_to_python(py: Python, value: &Value) -> PyResult<PyObject> {
@@ -81,150 +257,143 @@ fn lawkit_result_to_python(py: Python, result: &LawkitResult) -> PyResult<PyObje
 
     match result {
         LawkitResult::BenfordAnalysis(path, data) => {
-            dict.set_item("type", "BenfordAnalysis")?;
-            dict.set_item("path", path)?;
+            dict.set_item(intern!(py, "type"), "BenfordAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
             dict.set_item(
-                "observed_distribution",
+                intern!(py, "observed_distribution"),
                 data.observed_distribution.to_object(py),
             )?;
             dict.set_item(
-                "expected_distribution",
+                intern!(py, "expected_distribution"),
                 data.expected_distribution.to_object(py),
             )?;
-            dict.set_item("chi_square", data.chi_square)?;
-            dict.set_item("p_value", data.p_value)?;
-            dict.set_item("mad", data.mad)?;
-            dict.set_item("risk_level", &data.risk_level)?;
-            dict.set_item("total_numbers", data.total_numbers)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "chi_square"), data.chi_square)?;
+            dict.set_item(intern!(py, "p_value"), data.p_value)?;
+            dict.set_item(intern!(py, "mad"), data.mad)?;
+            dict.set_item(intern!(py, "risk_level"), &data.risk_level)?;
+            dict.set_item(intern!(py, "total_numbers"), data.total_numbers)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::ParetoAnalysis(path, data) => {
-            dict.set_item("type", "ParetoAnalysis")?;
-            dict.set_item("path", path)?;
+            dict.set_item(intern!(py, "type"), "ParetoAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
             dict.set_item(
-                "top_20_percent_contribution",
+                intern!(py, "top_20_percent_contribution"),
                 data.top_20_percent_contribution,
             )?;
-            dict.set_item("pareto_ratio", data.pareto_ratio)?;
-            dict.set_item("concentration_index", data.concentration_index)?;
-            dict.set_item("risk_level", &data.risk_level)?;
-            dict.set_item("total_items", data.total_items)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "pareto_ratio"), data.pareto_ratio)?;
+            dict.set_item(intern!(py, "concentration_index"), data.concentration_index)?;
+            dict.set_item(intern!(py, "risk_level"), &data.risk_level)?;
+            dict.set_item(intern!(py, "total_items"), data.total_items)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::ZipfAnalysis(path, data) => {
-            dict.set_item("type", "ZipfAnalysis")?;
-            dict.set_item("path", path)?;
-            dict.set_item("zipf_coefficient", data.zipf_coefficient)?;
-            dict.set_item("correlation_coefficient", data.correlation_coefficient)?;
-            dict.set_item("deviation_score", data.deviation_score)?;
-            dict.set_item("risk_level", &data.risk_level)?;
-            dict.set_item("total_items", data.total_items)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "type"), "ZipfAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "zipf_coefficient"), data.zipf_coefficient)?;
+            dict.set_item(
+                intern!(py, "correlation_coefficient"),
+                data.correlation_coefficient,
+            )?;
+            dict.set_item(intern!(py, "deviation_score"), data.deviation_score)?;
+            dict.set_item(intern!(py, "risk_level"), &data.risk_level)?;
+            dict.set_item(intern!(py, "total_items"), data.total_items)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::NormalAnalysis(path, data) => {
-            dict.set_item("type", "NormalAnalysis")?;
-            dict.set_item("path", path)?;
-            dict.set_item("mean", data.mean)?;
-            dict.set_item("std_dev", data.std_dev)?;
-            dict.set_item("skewness", data.skewness)?;
-            dict.set_item("kurtosis", data.kurtosis)?;
-            dict.set_item("normality_test_p", data.normality_test_p)?;
-            dict.set_item("risk_level", &data.risk_level)?;
-            dict.set_item("total_numbers", data.total_numbers)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "type"), "NormalAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "mean"), data.mean)?;
+            dict.set_item(intern!(py, "std_dev"), data.std_dev)?;
+            dict.set_item(intern!(py, "skewness"), data.skewness)?;
+            dict.set_item(intern!(py, "kurtosis"), data.kurtosis)?;
+            dict.set_item(intern!(py, "normality_test_p"), data.normality_test_p)?;
+            dict.set_item(intern!(py, "risk_level"), &data.risk_level)?;
+            dict.set_item(intern!(py, "total_numbers"), data.total_numbers)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::PoissonAnalysis(path, data) => {
-            dict.set_item("type", "PoissonAnalysis")?;
-            dict.set_item("path", path)?;
-            dict.set_item("lambda", data.lambda)?;
-            dict.set_item("variance_ratio", data.variance_ratio)?;
-            dict.set_item("poisson_test_p", data.poisson_test_p)?;
-            dict.set_item("risk_level", &data.risk_level)?;
-            dict.set_item("total_events", data.total_events)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "type"), "PoissonAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "lambda"), data.lambda)?;
+            dict.set_item(intern!(py, "variance_ratio"), data.variance_ratio)?;
+            dict.set_item(intern!(py, "poisson_test_p"), data.poisson_test_p)?;
+            dict.set_item(intern!(py, "risk_level"), &data.risk_level)?;
+            dict.set_item(intern!(py, "total_events"), data.total_events)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::IntegrationAnalysis(path, data) => {
-            dict.set_item("type", "IntegrationAnalysis")?;
-            dict.set_item("path", path)?;
-            dict.set_item("laws_analyzed", data.laws_analyzed.to_object(py))?;
-            dict.set_item("overall_risk", &data.overall_risk)?;
+            dict.set_item(intern!(py, "type"), "IntegrationAnalysis")?;
+            dict.set_item(intern!(py, "path"), path)?;
             dict.set_item(
-                "conflicting_results",
+                intern!(py, "laws_analyzed"),
+                data.laws_analyzed.to_object(py),
+            )?;
+            dict.set_item(intern!(py, "overall_risk"), &data.overall_risk)?;
+            dict.set_item(
+                intern!(py, "conflicting_results"),
                 data.conflicting_results.to_object(py),
             )?;
-            dict.set_item("recommendations", data.recommendations.to_object(py))?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(
+                intern!(py, "recommendations"),
+                data.recommendations.to_object(py),
+            )?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::ValidationResult(path, data) => {
-            dict.set_item("type", "ValidationResult")?;
-            dict.set_item("path", path)?;
-            dict.set_item("validation_passed", data.validation_passed)?;
-            dict.set_item("issues_found", data.issues_found.to_object(py))?;
-            dict.set_item("data_quality_score", data.data_quality_score)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "type"), "ValidationResult")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "validation_passed"), data.validation_passed)?;
+            dict.set_item(intern!(py, "issues_found"), data.issues_found.to_object(py))?;
+            dict.set_item(intern!(py, "data_quality_score"), data.data_quality_score)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::DiagnosticResult(path, data) => {
-            dict.set_item("type", "DiagnosticResult")?;
-            dict.set_item("path", path)?;
-            dict.set_item("diagnostic_type", &data.diagnostic_type)?;
-            dict.set_item("findings", data.findings.to_object(py))?;
-            dict.set_item("confidence_level", data.confidence_level)?;
-            dict.set_item("analysis_summary", &data.analysis_summary)?;
+            dict.set_item(intern!(py, "type"), "DiagnosticResult")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "diagnostic_type"), &data.diagnostic_type)?;
+            dict.set_item(intern!(py, "findings"), data.findings.to_object(py))?;
+            dict.set_item(intern!(py, "confidence_level"), data.confidence_level)?;
+            dict.set_item(intern!(py, "analysis_summary"), &data.analysis_summary)?;
         }
         LawkitResult::GeneratedData(path, data) => {
-            dict.set_item("type", "GeneratedData")?;
-            dict.set_item("path", path)?;
-            dict.set_item("data_type", &data.data_type)?;
-            dict.set_item("count", data.count)?;
-            dict.set_item("parameters", data.parameters.to_object(py))?;
-            dict.set_item("sample_data", data.sample_data.to_object(py))?;
+            dict.set_item(intern!(py, "type"), "GeneratedData")?;
+            dict.set_item(intern!(py, "path"), path)?;
+            dict.set_item(intern!(py, "data_type"), &data.data_type)?;
+            dict.set_item(intern!(py, "count"), data.count)?;
+            dict.set_item(intern!(py, "parameters"), data.parameters.to_object(py))?;
+            dict.set_item(intern!(py, "sample_data"), data.sample_data.to_object(py))?;
         }
     }
 
     Ok(dict.to_object(py))
 }
 
-/// Unified law function for Python
-///
-/// Perform statistical law analysis on Python data using various statistical laws.
-///
-/// # Arguments
-///
-/// * `subcommand` - The analysis subcommand ("benf", "pareto", "zipf", "normal", "poisson", "analyze", "validate", "diagnose", "generate")
-/// * `data_or_config` - The data to analyze or configuration for generation
-/// * `**kwargs` - Optional keyword arguments for configuration
-///
-/// # Returns
-///
-/// List of analysis result dictionaries specific to the statistical law used
-///
-/// # Example
-///
-/// ```python
-/// import lawkit
-///
-/// # Benford's law analysis
-/// data = [123, 456, 789, 1234, 5678]
-/// result = lawkit.law("benf", data)
-/// print(result)  # [{"type": "BenfordAnalysis", "conformity": 0.85, ...}]
+/// Compile a regex, reusing the compiled pattern across calls
 ///
-/// # Pareto analysis
-/// values = [100, 200, 300, 1000, 2000]
-/// result = lawkit.law("pareto", values)
-/// print(result)  # [{"type": "ParetoAnalysis", "concentration": 0.8, ...}]
-/// ```
-#[pyfunction(name = "law")]
-#[pyo3(signature = (subcommand, data_or_config, **kwargs))]
-fn law_py(
-    py: Python,
-    subcommand: &str,
-    data_or_config: &Bound<'_, PyAny>,
-    kwargs: Option<&Bound<'_, PyDict>>,
-) -> PyResult<PyObject> {
-    // Convert Python objects to serde_json::Value
-    let data_value = python_to_value(py, data_or_config)?;
+/// Loops that call `law()` with identical options would otherwise
+/// recompile the same `ignore_keys_regex` on every call.
+fn cached_regex(pattern: &str) -> Result<regex::Regex, regex::Error> {
+    static CACHE: OnceLock<Mutex<HashMap<String, regex::Regex>>> = OnceLock::new();
+
+    let mut cache = CACHE
+        .get_or_init(Default::default)
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner);
+    if let Some(regex) = cache.get(pattern) {
+        return Ok(regex.clone());
+    }
+
+    let regex = regex::Regex::new(pattern)?;
+    if cache.len() >= REGEX_CACHE_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(pattern.to_owned(), regex.clone());
+    Ok(regex)
+}
 
-    // Build options from kwargs
+/// Build LawkitOptions from Python keyword arguments
+fn build_options(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<LawkitOptions> {
     let mut options = LawkitOptions::default();
     let mut lawkit_options = LawkitSpecificOptions::default();
     let mut has_lawkit_options = false;
@@ -236,12 +405,9 @@ fn law_py(
                 // Core options - lawkit doesn't have epsilon or array_id_key
                 "ignore_keys_regex" => {
                     if let Ok(pattern) = value.extract::<String>() {
-                        options.ignore_keys_regex =
-                            Some(regex::Regex::new(&pattern).map_err(|e| {
-                                pyo3::exceptions::PyValueError::new_err(format!(
-                                    "Invalid regex: {e}"
-                                ))
-                            })?);
+                        options.ignore_keys_regex = Some(cached_regex(&pattern).map_err(|e| {
+                            pyo3::exceptions::PyValueError::new_err(format!("Invalid regex: {e}"))
+                        })?);
                     }
                 }
                 "path_filter" => {
@@ -352,24 +518,724 @@ fn law_py(
         options.lawkit_options = Some(lawkit_options);
     }
 
-    // Perform law analysis
-    let results = law(subcommand, &data_value, Some(&options)).map_err(|e| {
-        pyo3::exceptions::PyRuntimeError::new_err(format!("Law analysis error: {e:?}"))
-    })?;
+    Ok(options)
+}
+
+/// Serialize keyword options to a canonical string for cache keys
+fn kwargs_key(py: Python, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<String> {
+    Ok(match kwargs {
+        Some(kwargs) => python_to_value(py, kwargs.as_any())?.to_string(),
+        None => Value::Null.to_string(),
+    })
+}
+
+/// Reusable analysis options
+///
+/// Accepts the same keyword options as `law()` and parses them once, so
+/// loops can pass one `Options` object to many calls instead of having a
+/// kwargs dict re-parsed on every call.
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// options = lawkit.Options(risk_threshold="high", confidence_level=0.99)
+/// for batch in batches:
+///     result = lawkit.law("benf", batch, options=options)
+/// ```
+#[pyclass(name = "Options", module = "lawkit", frozen)]
+struct PyOptions {
+    options: LawkitOptions,
+    /// The keyword options as JSON, used in `generate` cache keys and repr
+    key: String,
+}
+
+#[pymethods]
+impl PyOptions {
+    #[new]
+    #[pyo3(signature = (**kwargs))]
+    fn new(py: Python, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<Self> {
+        Ok(Self {
+            options: build_options(kwargs)?,
+            key: kwargs_key(py, kwargs)?,
+        })
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Options({})", self.key)
+    }
+}
+
+/// Options for one call: a shared `Options` object or freshly parsed kwargs
+enum ResolvedOptions<'a> {
+    Shared(&'a PyOptions),
+    Parsed(LawkitOptions),
+}
+
+impl ResolvedOptions<'_> {
+    /// Cache key for these options
+    fn key(&self, py: Python, kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<String> {
+        match self {
+            ResolvedOptions::Shared(options) => Ok(options.key.clone()),
+            ResolvedOptions::Parsed(_) => kwargs_key(py, kwargs),
+        }
+    }
+}
+
+impl std::ops::Deref for ResolvedOptions<'_> {
+    type Target = LawkitOptions;
+
+    fn deref(&self) -> &LawkitOptions {
+        match self {
+            ResolvedOptions::Shared(options) => &options.options,
+            ResolvedOptions::Parsed(options) => options,
+        }
+    }
+}
+
+/// Use a prebuilt `Options` object if given, otherwise parse keyword options
+fn resolve_options<'a>(
+    options: Option<&'a Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<ResolvedOptions<'a>> {
+    match options {
+        Some(options) => {
+            if kwargs.is_some_and(|kwargs| !kwargs.is_empty()) {
+                return Err(pyo3::exceptions::PyTypeError::new_err(
+                    "Pass either options= or keyword options, not both",
+                ));
+            }
+            Ok(ResolvedOptions::Shared(options.get()))
+        }
+        None => Ok(ResolvedOptions::Parsed(build_options(kwargs)?)),
+    }
+}
 
-    // Convert results to Python objects
+/// Convert a law error into a Python exception
+fn analysis_error(message: String) -> PyErr {
+    pyo3::exceptions::PyRuntimeError::new_err(format!("Law analysis error: {message}"))
+}
+
+/// Convert analysis results to a Python list of dictionaries
+fn results_to_python(py: Python, results: &[LawkitResult]) -> PyResult<PyObject> {
     let py_list = pyo3::types::PyList::empty_bound(py);
     for result in results {
-        py_list.append(lawkit_result_to_python(py, &result)?)?;
+        py_list.append(lawkit_result_to_python(py, result)?)?;
+    }
+
+    Ok(py_list.to_object(py))
+}
+
+/// Perform a law analysis without holding the GIL so other Python threads can run
+fn analyze(
+    py: Python,
+    subcommand: &str,
+    data_value: &Value,
+    options: &LawkitOptions,
+) -> PyResult<Vec<LawkitResult>> {
+    py.allow_threads(|| law(subcommand, data_value, Some(options)).map_err(|e| format!("{e:?}")))
+        .map_err(analysis_error)
+}
+
+/// Run a law analysis and convert the results to a Python list
+fn run_law(
+    py: Python,
+    subcommand: &str,
+    data_value: &Value,
+    options: &LawkitOptions,
+) -> PyResult<PyObject> {
+    let results = analyze(py, subcommand, data_value, options)?;
+
+    results_to_python(py, &results)
+}
+
+/// Cached seeded `generate` results and the number of samples they hold
+#[derive(Default)]
+struct GenerateCache {
+    entries: HashMap<String, Arc<Vec<LawkitResult>>>,
+    samples: usize,
+}
+
+/// Number of generated samples held by a result list
+fn sample_count(results: &[LawkitResult]) -> usize {
+    results
+        .iter()
+        .map(|result| match result {
+            LawkitResult::GeneratedData(_, data) => data.sample_data.len(),
+            _ => 0,
+        })
+        .sum()
+}
+
+/// Run a seeded `generate` request, reusing the results of an identical earlier request
+///
+/// Seeded generation is deterministic, so the same config and options
+/// always produce the same data. Results are cached on the Rust side and
+/// converted to fresh Python objects on every call, so callers may mutate
+/// what they get back. The cache holds at most `GENERATE_CACHE_CAPACITY`
+/// results and `GENERATE_CACHE_MAX_SAMPLES` samples in total.
+fn run_generate_cached(
+    py: Python,
+    config: &Value,
+    options_key: &str,
+    options: &LawkitOptions,
+) -> PyResult<PyObject> {
+    static CACHE: OnceLock<Mutex<GenerateCache>> = OnceLock::new();
+
+    let key = format!("{config}|{options_key}");
+    let cache = CACHE.get_or_init(Default::default);
+
+    let cached = cache
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .entries
+        .get(&key)
+        .cloned();
+    let results = match cached {
+        Some(results) => results,
+        None => {
+            let results = Arc::new(analyze(py, "generate", config, options)?);
+            let samples = sample_count(&results);
+            if samples <= GENERATE_CACHE_MAX_SAMPLES {
+                let mut cache = cache.lock().unwrap_or_else(PoisonError::into_inner);
+                if cache.entries.len() >= GENERATE_CACHE_CAPACITY
+                    || cache.samples + samples > GENERATE_CACHE_MAX_SAMPLES
+                {
+                    *cache = GenerateCache::default();
+                }
+                if let Some(previous) = cache.entries.insert(key, Arc::clone(&results)) {
+                    cache.samples -= sample_count(&previous);
+                }
+                cache.samples += samples;
+            }
+            results
+        }
+    };
+
+    results_to_python(py, &results)
+}
+
+/// Run several analyses under a single GIL release
+///
+/// Returns one result list per job, in job order.
+fn run_law_jobs(
+    py: Python,
+    jobs: &[(&str, &Value)],
+    options: &LawkitOptions,
+) -> PyResult<PyObject> {
+    let all_results = py
+        .allow_threads(|| {
+            jobs.iter()
+                .map(|(subcommand, data_value)| {
+                    law(subcommand, data_value, Some(options)).map_err(|e| format!("{e:?}"))
+                })
+                .collect::<Result<Vec<_>, _>>()
+        })
+        .map_err(analysis_error)?;
+
+    let py_list = pyo3::types::PyList::empty_bound(py);
+    for results in &all_results {
+        py_list.append(results_to_python(py, results)?)?;
     }
 
     Ok(py_list.to_object(py))
 }
 
+/// Unified law function for Python
+///
+/// Perform statistical law analysis on Python data using various statistical laws.
+///
+/// # Arguments
+///
+/// * `subcommand` - The analysis subcommand ("benf", "pareto", "zipf", "normal", "poisson", "analyze", "validate", "diagnose", "generate")
+/// * `data_or_config` - The data to analyze or configuration for generation
+/// * `rows` - Analyze each row of 2-D data (e.g. `np.stack(batches)` or a list
+///   of lists) separately, in one call. By default the whole input is one
+///   dataset, and multi-dimensional buffers are flattened
+/// * `options` - A reusable `Options` object, instead of keyword arguments
+/// * `**kwargs` - Optional keyword arguments for configuration
+///
+/// # Returns
+///
+/// List of analysis result dictionaries specific to the statistical law used.
+/// With `rows=True`, a list of per-row result lists.
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// # Benford's law analysis
+/// data = [123, 456, 789, 1234, 5678]
+/// result = lawkit.law("benf", data)
+/// print(result)  # [{"type": "BenfordAnalysis", "conformity": 0.85, ...}]
+///
+/// # Pareto analysis
+/// values = [100, 200, 300, 1000, 2000]
+/// result = lawkit.law("pareto", values)
+/// print(result)  # [{"type": "ParetoAnalysis", "concentration": 0.8, ...}]
+/// ```
+#[pyfunction(name = "law")]
+#[pyo3(signature = (subcommand, data_or_config, *, rows = false, options = None, **kwargs))]
+fn law_py(
+    py: Python,
+    subcommand: &str,
+    data_or_config: &Bound<'_, PyAny>,
+    rows: bool,
+    options: Option<&Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    if rows {
+        // Rows are analyzed separately, crossing into Rust only once
+        let Value::Array(row_values) = python_to_value(py, data_or_config)? else {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "rows=True expects 2-D data",
+            ));
+        };
+        if !row_values.iter().all(Value::is_array) {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "rows=True expects every row to be a sequence",
+            ));
+        }
+        let options = resolve_options(options, kwargs)?;
+        let jobs: Vec<(&str, &Value)> = row_values.iter().map(|row| (subcommand, row)).collect();
+        return run_law_jobs(py, &jobs, &options);
+    }
+
+    // Convert Python objects to serde_json::Value
+    let data_value = data_to_value(py, data_or_config)?;
+    let options = resolve_options(options, kwargs)?;
+
+    if subcommand == "generate" && data_value.get("seed").is_some_and(|seed| !seed.is_null()) {
+        let options_key = options.key(py, kwargs)?;
+        return run_generate_cached(py, &data_value, &options_key, &options);
+    }
+
+    run_law(py, subcommand, &data_value, &options)
+}
+
+/// Run several statistical law analyses on the same data in one call
+///
+/// The data and options are converted once and all analyses run under a
+/// single GIL release, instead of one `law()` call per subcommand.
+///
+/// # Arguments
+///
+/// * `subcommands` - The analysis subcommands to run, as for `law()`
+/// * `data_or_config` - The data to analyze
+/// * `options` / `**kwargs` - Optional configuration, as for `law()`
+///
+/// # Returns
+///
+/// List with one result list per subcommand, in the given order
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// benford, pareto = lawkit.law_batch(["benf", "pareto"], [123, 456, 789, 1234, 5678])
+/// ```
+#[pyfunction]
+#[pyo3(signature = (subcommands, data_or_config, *, options = None, **kwargs))]
+fn law_batch(
+    py: Python,
+    subcommands: Vec<String>,
+    data_or_config: &Bound<'_, PyAny>,
+    options: Option<&Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    let data_value = data_to_value(py, data_or_config)?;
+    let options = resolve_options(options, kwargs)?;
+
+    let jobs: Vec<(&str, &Value)> = subcommands
+        .iter()
+        .map(|subcommand| (subcommand.as_str(), &data_value))
+        .collect();
+    run_law_jobs(py, &jobs, &options)
+}
+
+/// Run one analysis on several slices of the same data in one call
+///
+/// The data is converted once and each `(start, end)` chunk is analyzed
+/// under a single GIL release, instead of one `law()` call per slice.
+///
+/// # Arguments
+///
+/// * `subcommand` - The analysis subcommand, as for `law()`
+/// * `data` - The data sequence to slice (multi-dimensional buffers are flattened)
+/// * `chunks` - `(start, end)` index pairs selecting `data[start:end]`. Unlike
+///   Python slices, bounds are strict: `0 <= start <= end <= len(data)` must
+///   hold, otherwise `ValueError` is raised (no clamping or negative indices)
+/// * `options` / `**kwargs` - Optional configuration, as for `law()`
+///
+/// # Returns
+///
+/// List with one result list per chunk, in the given order
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// data = list(range(1, 1001))
+/// results = lawkit.law_chunked("validate", data, [(0, 500), (500, 1000)])
+/// ```
+#[pyfunction]
+#[pyo3(signature = (subcommand, data, chunks, *, options = None, **kwargs))]
+fn law_chunked(
+    py: Python,
+    subcommand: &str,
+    data: &Bound<'_, PyAny>,
+    chunks: Vec<(i64, i64)>,
+    options: Option<&Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    let data_value = data_to_value(py, data)?;
+    let Value::Array(values) = &data_value else {
+        return Err(pyo3::exceptions::PyTypeError::new_err(
+            "law_chunked() data must be a sequence",
+        ));
+    };
+    let options = resolve_options(options, kwargs)?;
+
+    let chunk_values = chunks
+        .iter()
+        .map(|&(start, end)| {
+            let invalid = |reason: &str| {
+                pyo3::exceptions::PyValueError::new_err(format!("Chunk ({start}, {end}) {reason}"))
+            };
+            let (Ok(first), Ok(last)) = (usize::try_from(start), usize::try_from(end)) else {
+                return Err(invalid("has a negative index"));
+            };
+            if first > last {
+                return Err(invalid("is reversed: start must not exceed end"));
+            }
+            values
+                .get(first..last)
+                .map(|chunk| Value::Array(chunk.to_vec()))
+                .ok_or_else(|| invalid(&format!("is out of range for {} values", values.len())))
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+    let jobs: Vec<(&str, &Value)> = chunk_values
+        .iter()
+        .map(|chunk| (subcommand, chunk))
+        .collect();
+    run_law_jobs(py, &jobs, &options)
+}
+
+/// Parse the numbers on one CSV line
+///
+/// Every comma-separated field that parses as a finite number is kept;
+/// headers, blank lines and other non-numeric fields are skipped. A quoted
+/// field is one field even if it contains commas, which are read as
+/// thousands separators (`"1,234.56"` is 1234.56).
+fn csv_line_numbers(line: &str) -> impl Iterator<Item = Value> + '_ {
+    let mut in_quotes = false;
+    line.split(move |c| {
+        if c == '"' {
+            in_quotes = !in_quotes;
+        }
+        c == ',' && !in_quotes
+    })
+    .filter_map(|field| {
+        let field = field.trim();
+        match field.strip_prefix('"') {
+            Some(quoted) => quoted
+                .trim_end_matches('"')
+                .replace(',', "")
+                .trim()
+                .parse::<f64>()
+                .ok(),
+            None => field.parse::<f64>().ok(),
+        }
+    })
+    .filter(|f| f.is_finite())
+    .map(f64_to_value)
+}
+
+/// Parse numbers from CSV or newline-separated text
+fn parse_csv_numbers(content: &str) -> Value {
+    Value::Array(content.lines().flat_map(csv_line_numbers).collect())
+}
+
+/// Read numbers from a CSV file line by line, without loading the whole file into a string
+fn read_csv_numbers(mut reader: impl BufRead) -> std::io::Result<Value> {
+    let mut values = Vec::new();
+    let mut line = String::new();
+    while reader.read_line(&mut line)? != 0 {
+        values.extend(csv_line_numbers(&line));
+        line.clear();
+    }
+
+    Ok(Value::Array(values))
+}
+
+/// Parse raw little-endian float64 bytes, reading each byte with `byte`
+///
+/// Generic over the element so Python buffers can be decoded in place
+/// through their `ReadOnlyCell`s as well as from owned bytes.
+fn parse_f64_bytes<T>(bytes: &[T], byte: impl Fn(&T) -> u8) -> PyResult<Value> {
+    if bytes.len() % 8 != 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Binary content length must be a multiple of 8 bytes, got {}",
+            bytes.len()
+        )));
+    }
+
+    Ok(Value::Array(
+        bytes
+            .chunks_exact(8)
+            .map(|chunk| {
+                let mut le_bytes = [0u8; 8];
+                for (dst, src) in le_bytes.iter_mut().zip(chunk) {
+                    *dst = byte(src);
+                }
+                f64_to_value(f64::from_le_bytes(le_bytes))
+            })
+            .collect(),
+    ))
+}
+
+/// Error for an unsupported `format` argument
+fn unknown_format_error(format: &str) -> PyErr {
+    pyo3::exceptions::PyValueError::new_err(format!(
+        "Unknown format: {format} (expected \"csv\", \"json\" or \"bin\")"
+    ))
+}
+
+/// Parse JSON text into serde_json::Value
+fn parse_json(content: &str) -> PyResult<Value> {
+    serde_json::from_str(content)
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid JSON: {e}")))
+}
+
+/// Perform statistical law analysis on data parsed from a string
+///
+/// # Arguments
+///
+/// * `content` - The data to analyze, in the given format
+/// * `subcommand` - The analysis subcommand, as for `law()`
+/// * `format` - How to parse `content`:
+///   - `"csv"` - CSV or newline-separated numbers; non-numeric fields such as headers are skipped
+///   - `"json"` - JSON text, parsed natively without building Python objects
+///   - `"bin"` - a bytes-like object of little-endian float64 values; `bytes` and
+///     other contiguous buffers are decoded in place, others are copied once first
+/// * `options` / `**kwargs` - Optional configuration, as for `law()`
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// result = lawkit.law_from_string("amount\n123.45\n456.78\n789.12", "benf")
+/// result = lawkit.law_from_string("[123, 456, 789]", "benf", format="json")
+/// result = lawkit.law_from_string(values.astype("<f8").tobytes(), "benf", format="bin")
+/// ```
+#[pyfunction]
+#[pyo3(signature = (content, subcommand, format = "csv", *, options = None, **kwargs))]
+fn law_from_string(
+    py: Python,
+    content: &Bound<'_, PyAny>,
+    subcommand: &str,
+    format: &str,
+    options: Option<&Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    // Parse without holding the GIL wherever the input can't change underneath
+    let data_value = match format {
+        "csv" => {
+            let content = content.extract::<String>()?;
+            py.allow_threads(|| parse_csv_numbers(&content))
+        }
+        "json" => {
+            let content = content.extract::<String>()?;
+            py.allow_threads(|| parse_json(&content))?
+        }
+        "bin" => {
+            if let Ok(bytes) = content.downcast::<pyo3::types::PyBytes>() {
+                // bytes are immutable, so they are decoded in place without the GIL
+                let bytes = bytes.as_bytes();
+                py.allow_threads(|| parse_f64_bytes(bytes, |b| *b))?
+            } else {
+                let buffer = PyBuffer::<u8>::get_bound(content)?;
+                match buffer.as_slice(py) {
+                    // Other contiguous buffers may be mutated by other threads,
+                    // so they are decoded in place while holding the GIL
+                    Some(cells) => parse_f64_bytes(cells, ReadOnlyCell::get)?,
+                    None => {
+                        let bytes = buffer.to_vec(py)?;
+                        py.allow_threads(|| parse_f64_bytes(&bytes, |b| *b))?
+                    }
+                }
+            }
+        }
+        _ => return Err(unknown_format_error(format)),
+    };
+    let options = resolve_options(options, kwargs)?;
+
+    run_law(py, subcommand, &data_value, &options)
+}
+
+/// Infer the `law_from_file` format from the file extension
+fn format_from_extension(path: &Path) -> &'static str {
+    match path.extension().and_then(|ext| ext.to_str()) {
+        Some(ext) if ext.eq_ignore_ascii_case("json") => "json",
+        Some(ext) if ext.eq_ignore_ascii_case("bin") || ext.eq_ignore_ascii_case("f64") => "bin",
+        _ => "csv",
+    }
+}
+
+/// Read data from a file, streaming it instead of loading it into a Python string
+fn read_data_file(path: &Path, format: &str) -> PyResult<Value> {
+    match format {
+        "csv" => Ok(read_csv_numbers(BufReader::new(File::open(path)?))?),
+        "json" => serde_json::from_reader(BufReader::new(File::open(path)?))
+            .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("Invalid JSON: {e}"))),
+        "bin" => parse_f64_bytes(&std::fs::read(path)?, |b| *b),
+        _ => Err(unknown_format_error(format)),
+    }
+}
+
+/// Perform statistical law analysis on data read from a file
+///
+/// # Arguments
+///
+/// * `file_path` - Path to the data file
+/// * `subcommand` - The analysis subcommand, as for `law()`
+/// * `format` - `"csv"`, `"json"` or `"bin"`, as for `law_from_string()`.
+///   Inferred from the extension when omitted: `.json` is JSON, `.bin`/`.f64`
+///   is little-endian float64, and anything else is read as CSV
+/// * `options` / `**kwargs` - Optional configuration, as for `law()`
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// result = lawkit.law_from_file("invoices.csv", "benf")
+/// result = lawkit.law_from_file("amounts.dat", "benf", format="bin")
+/// ```
+#[pyfunction]
+#[pyo3(signature = (file_path, subcommand, format = None, *, options = None, **kwargs))]
+fn law_from_file(
+    py: Python,
+    file_path: PathBuf,
+    subcommand: &str,
+    format: Option<&str>,
+    options: Option<&Bound<'_, PyOptions>>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    let format = format.unwrap_or_else(|| format_from_extension(&file_path));
+    // File I/O and parsing don't touch Python objects, so release the GIL
+    let data_value = py.allow_threads(|| read_data_file(&file_path, format))?;
+    let options = resolve_options(options, kwargs)?;
+
+    run_law(py, subcommand, &data_value, &options)
+}
+
+/// Powers of ten that are exactly representable as f64
+const POW10: [f64; 23] = [
+    1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11, 1e12, 1e13, 1e14, 1e15, 1e16,
+    1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+];
+
+/// Leading decimal digit of an integer (0 for zero)
+fn integer_first_digit(mut n: u64) -> u8 {
+    while n >= 10 {
+        n /= 10;
+    }
+    n as u8
+}
+
+/// Leading decimal digit of |x| (0 for zero, NaN and infinities)
+fn first_digit(x: f64) -> u8 {
+    let x = x.abs();
+    if x == 0.0 || !x.is_finite() {
+        return 0;
+    }
+    // Integers below 2^53 are exact, so strip digits without formatting
+    if x < 9_007_199_254_740_992.0 && x.fract() == 0.0 {
+        return integer_first_digit(x as u64);
+    }
+    // floor(log10(2^e)) from the binary exponent; floor(log10(x)) is this or one more
+    let exp2 = ((x.to_bits() >> 52) & 0x7ff) as i64 - 1023;
+    let exp10 = (exp2 * 78_913) >> 18;
+    if let Some(&scale) = POW10.get(exp10.unsigned_abs() as usize) {
+        // One correctly rounded operation by an exact power keeps the
+        // significand within a few ulps of its true value in [1, 20)
+        let mut m = if exp10 < 0 { x * scale } else { x / scale };
+        if m >= 10.0 {
+            m /= 10.0;
+        }
+        let digit = m.trunc();
+        if m - digit > 1e-12 && digit + 1.0 - m > 1e-12 {
+            return digit as u8;
+        }
+    }
+    // Subnormals, very large or small magnitudes, and values too close to a
+    // digit boundary: scientific notation always starts with the leading
+    // significant digit of the shortest round-trip representation
+    format!("{x:e}").as_bytes()[0] - b'0'
+}
+
+/// Extract the leading digit of each number
+///
+/// Normalizes data once for Benford-style pre-processing, so callers do not
+/// need a per-element `floor(log10(abs(x)))` loop in Python.
+///
+/// # Arguments
+///
+/// * `data` - A list, tuple or numeric buffer (NumPy array, array.array)
+///
+/// # Returns
+///
+/// List of leading digits (1-9), with 0 for zero, NaN and infinite values
+///
+/// # Example
+///
+/// ```python
+/// import lawkit
+///
+/// lawkit.first_digits([123, 0.045, -9876, 0])  # [1, 4, 9, 0]
+/// ```
+#[pyfunction]
+fn first_digits(py: Python, data: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    let Value::Array(items) = data_to_value(py, data)? else {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "first_digits expects a sequence of numbers",
+        ));
+    };
+
+    items
+        .iter()
+        .map(|item| match item {
+            Value::Null => Ok(0),
+            // Integers are read exactly; above 2^53 an f64 could round
+            // across a digit boundary (19999999999999999 -> 2e16)
+            Value::Number(n) => Ok(match (n.as_u64(), n.as_i64()) {
+                (Some(u), _) => integer_first_digit(u),
+                (None, Some(i)) => integer_first_digit(i.unsigned_abs()),
+                (None, None) => n.as_f64().map_or(0, first_digit),
+            }),
+            _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "first_digits expects numbers, got {item}"
+            ))),
+        })
+        .collect()
+}
+
 /// A Python module for statistical law analysis toolkit
 #[pymodule]
 fn _lawkit(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<PyOptions>()?;
     m.add_function(wrap_pyfunction!(law_py, m)?)?;
+    m.add_function(wrap_pyfunction!(law_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(law_chunked, m)?)?;
+    m.add_function(wrap_pyfunction!(law_from_string, m)?)?;
+    m.add_function(wrap_pyfunction!(law_from_file, m)?)?;
+    m.add_function(wrap_pyfunction!(first_digits, m)?)?;
     m.add("__version__", "2.6.0")?;
     Ok(())
 }
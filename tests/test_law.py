@@ -1,5 +1,13 @@
+import functools
+import importlib.util
+import json
+import math
+import struct
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -10,6 +18,24 @@ try:
 except ImportError:
     pytest.skip("lawkit module not built", allow_module_level=True)
 
+# Read-only datasets shared across tests, built once at import. Tuples keep them
+# hashable for reference_results(); tests of the documented list input pass list(...)
+SAMPLE_DATA = (123, 234, 345, 456, 567, 678, 789, 890, 901)
+FLOAT_DATA = (123.5, 234.25, 345.0, 156.75, 178.0, 189.5, 267.0, 289.25, 378.0)
+FLOAT_BUFFER = memoryview(array("d", FLOAT_DATA)).toreadonly()
+FLOAT_BLOB = struct.pack(f"<{len(FLOAT_DATA)}d", *FLOAT_DATA)
+GENERATION_CONFIG = MappingProxyType({"type": "benford", "count": 100, "seed": 12345})
+BENFORD_DATA = (
+    123, 234, 345, 156, 178, 189, 267, 289, 378,
+    412, 523, 634, 745, 856, 967, 1234, 2345, 3456
+)
+
+
+@functools.lru_cache(maxsize=None)
+def reference_results(subcommand, data):
+    """Analyze a shared dataset once; callers must not mutate the result"""
+    return lawkit.law(subcommand, data)
+
 
 class TestBasicAPI:
     """Test basic law() function"""
@@ -19,132 +45,472 @@ class TestBasicAPI:
         assert callable(lawkit.law)
 
     def test_returns_list(self):
-        data = [123, 234, 345, 456, 567, 678, 789, 890, 901]
-        results = lawkit.law("validate", data)
+        results = lawkit.law("validate", list(SAMPLE_DATA))
         assert isinstance(results, list)
 
 
-class TestBenfordAnalysis:
-    """Test Benford's law analysis"""
-
-    def test_benford_analysis(self):
-        data = [
-            123, 234, 345, 156, 178, 189, 267, 289, 378,
-            412, 523, 634, 745, 856, 967, 1234, 2345, 3456
-        ]
-
-        results = lawkit.law("benford", data)
+class TestLawAnalysis:
+    """Test the result shape of each statistical law"""
+
+    @pytest.mark.parametrize(
+        "subcommand, data, result_type, fields",
+        [
+            (
+                "benford",
+                BENFORD_DATA,
+                "BenfordAnalysis",
+                {"observed_distribution", "expected_distribution", "chi_square", "p_value", "risk_level"},
+            ),
+            (
+                "pareto",
+                (10000, 9000, 8000, 7000, 1000, 900, 800, 700, 600, 500, 400, 300, 200, 100),
+                "ParetoAnalysis",
+                {"top_20_percent_contribution", "pareto_ratio", "concentration_index"},
+            ),
+            (
+                "zipf",
+                (1000, 500, 333, 250, 200, 167, 143, 125, 111, 100),
+                "ZipfAnalysis",
+                {"zipf_coefficient", "correlation_coefficient"},
+            ),
+            (
+                "normal",
+                (
+                    98, 99, 100, 101, 102, 99, 100, 101, 100, 99,
+                    101, 100, 99, 100, 101, 98, 102, 100, 99, 101
+                ),
+                "NormalAnalysis",
+                {"mean", "std_dev", "skewness", "kurtosis"},
+            ),
+            (
+                "poisson",
+                (0, 1, 2, 1, 3, 0, 2, 1, 4, 2, 1, 0, 3, 2, 1, 5, 0, 2, 1, 3),
+                "PoissonAnalysis",
+                {"lambda", "variance_ratio"},
+            ),
+            (
+                "validate",
+                SAMPLE_DATA,
+                "ValidationResult",
+                {"validation_passed", "data_quality_score"},
+            ),
+        ],
+    )
+    def test_analysis(self, subcommand, data, result_type, fields):
+        results = lawkit.law(subcommand, list(data))
 
         assert len(results) == 1
         result = results[0]
-        assert result["type"] == "BenfordAnalysis"
-        assert "observed_distribution" in result
-        assert "expected_distribution" in result
-        assert "chi_square" in result
-        assert "p_value" in result
-        assert "risk_level" in result
+        assert result["type"] == result_type
+        assert result.keys() >= fields
 
+    def test_benford_distributions(self):
+        result = lawkit.law("benford", list(BENFORD_DATA))[0]
 
-class TestParetoAnalysis:
-    """Test Pareto analysis"""
+        observed = result["observed_distribution"]
+        expected = result["expected_distribution"]
+        assert len(observed) == len(expected)
+        assert min(observed) >= 0 and min(expected) >= 0
+        assert math.isclose(math.fsum(observed), math.fsum(expected), rel_tol=1e-3)
 
-    def test_pareto_analysis(self):
-        data = [
-            10000, 9000, 8000, 7000,
-            1000, 900, 800, 700, 600, 500, 400, 300, 200, 100
-        ]
+
+class TestBatchAnalysis:
+    """Test running several analyses in one call"""
+
+    def test_law_batch(self):
+        subcommands = ["benford", "pareto", "normal", "validate"]
+
+        results = lawkit.law_batch(subcommands, SAMPLE_DATA)
+
+        assert results == [reference_results(subcommand, SAMPLE_DATA) for subcommand in subcommands]
+
+    def test_law_batch_with_options(self):
+        results = lawkit.law_batch(["benford"], SAMPLE_DATA, risk_threshold="high")
+
+        assert results == [lawkit.law("benford", SAMPLE_DATA, risk_threshold="high")]
+
+    def test_law_batch_unknown_subcommand(self):
+        with pytest.raises(Exception):
+            lawkit.law_batch(["benford", "unknown"], SAMPLE_DATA)
+
+    def test_law_chunked(self):
+        data = list(range(1, 1001))
+        chunks = [(start, start + 100) for start in range(0, 1000, 100)]
+
+        results = lawkit.law_chunked("validate", data, chunks)
+
+        assert results == [lawkit.law("validate", data[start:end]) for start, end in chunks]
+
+    def test_law_chunked_out_of_range(self):
+        with pytest.raises(ValueError):
+            lawkit.law_chunked("validate", SAMPLE_DATA, [(0, len(SAMPLE_DATA) + 1)])
+
+    @pytest.mark.parametrize("chunk", [(5, 2), (-3, 2)])
+    def test_law_chunked_reversed_or_negative(self, chunk):
+        with pytest.raises(ValueError, match="reversed|negative"):
+            lawkit.law_chunked("validate", SAMPLE_DATA, [chunk])
+
+
+class TestGeneration:
+    """Test data generation"""
+
+    def test_seeded_generation_is_repeatable(self):
+        cached = lawkit.law("generate", GENERATION_CONFIG)
+        # law_batch() bypasses the seeded generate cache, so this is a fresh run
+        [uncached] = lawkit.law_batch(["generate"], dict(GENERATION_CONFIG))
+
+        assert cached == uncached
+        assert cached == lawkit.law("generate", GENERATION_CONFIG)
+        assert cached[0]["type"] == "GeneratedData"
+        assert all(map(math.isfinite, cached[0]["sample_data"]))
+
+    def test_seeded_generation_returns_fresh_objects(self):
+        first = lawkit.law("generate", GENERATION_CONFIG)
+        first[0]["sample_data"].clear()
+        second = lawkit.law("generate", GENERATION_CONFIG)
+
+        assert second[0]["sample_data"]
+
+
+class TestSequenceInput:
+    """Test non-list sequence input"""
+
+    def test_tuple_input(self):
+        data = (10000, 9000, 8000, 7000, 1000, 900, 800, 700, 600, 500)
 
         results = lawkit.law("pareto", data)
 
-        assert len(results) == 1
-        result = results[0]
-        assert result["type"] == "ParetoAnalysis"
-        assert "top_20_percent_contribution" in result
-        assert "pareto_ratio" in result
-        assert "concentration_index" in result
+        assert results == lawkit.law("pareto", list(data))
 
 
-class TestZipfAnalysis:
-    """Test Zipf analysis"""
+class TestBufferInput:
+    """Test buffer-protocol input (array.array, NumPy arrays, memoryview)"""
 
-    def test_zipf_analysis(self):
-        data = [1000, 500, 333, 250, 200, 167, 143, 125, 111, 100]
+    def test_float64_buffer(self):
+        results = lawkit.law("benford", array("d", FLOAT_DATA))
 
-        results = lawkit.law("zipf", data)
+        assert results == reference_results("benford", FLOAT_DATA)
 
-        assert len(results) == 1
-        result = results[0]
-        assert result["type"] == "ZipfAnalysis"
-        assert "zipf_coefficient" in result
-        assert "correlation_coefficient" in result
+    def test_float32_buffer(self):
+        results = lawkit.law("benford", array("f", FLOAT_DATA))
+
+        assert results == reference_results("benford", FLOAT_DATA)
+
+    def test_int64_buffer(self):
+        data = [123, 234, 345, 156, 178, 189, 267, 289, 378, 412, 523, 634]
+
+        results = lawkit.law("benford", array("q", data))
+
+        assert results == lawkit.law("benford", data)
+
+    @pytest.mark.parametrize("typecode", ["b", "h", "H", "Q"])
+    def test_small_and_unsigned_integer_buffers(self, typecode):
+        data = [1, 12, 23, 34, 45, 56, 67, 78, 89, 101, 112, 123]
+
+        results = lawkit.law("benford", array(typecode, data))
 
+        assert results == lawkit.law("benford", data)
 
-class TestNormalAnalysis:
-    """Test normal distribution analysis"""
+    def test_unsupported_buffer_format(self):
+        with pytest.raises(TypeError):
+            lawkit.law("benford", memoryview(bytes([1, 0, 1])).cast("?"))
 
-    def test_normal_analysis(self):
-        data = [
-            98, 99, 100, 101, 102, 99, 100, 101, 100, 99,
-            101, 100, 99, 100, 101, 98, 102, 100, 99, 101
+    def test_readonly_memoryview(self):
+        results = lawkit.law("benford", FLOAT_BUFFER)
+
+        assert results == reference_results("benford", FLOAT_DATA)
+
+    def test_2d_buffer_analyzed_per_row(self):
+        rows = [
+            [123.0, 234.0, 345.0, 156.0, 178.0, 189.0, 267.0, 289.0, 378.0],
+            [912.0, 823.0, 734.0, 645.0, 556.0, 467.0, 978.0, 889.0, 791.0],
+            [412.0, 523.0, 634.0, 745.0, 856.0, 967.0, 1234.0, 2345.0, 3456.0],
         ]
+        flat = array("d", [x for row in rows for x in row])
+        stacked = memoryview(flat).cast("B").cast("d", [len(rows), len(rows[0])])
 
-        results = lawkit.law("normal", data)
+        results = lawkit.law("benford", stacked, rows=True)
 
-        assert len(results) == 1
-        result = results[0]
-        assert result["type"] == "NormalAnalysis"
-        assert "mean" in result
-        assert "std_dev" in result
-        assert "skewness" in result
-        assert "kurtosis" in result
+        assert results == [lawkit.law("benford", row) for row in rows]
+        assert lawkit.law("benford", rows, rows=True) == results
 
+    def test_2d_buffer_analyzed_as_whole_by_default(self):
+        column = memoryview(array("d", FLOAT_DATA)).cast("B").cast("d", [len(FLOAT_DATA), 1])
 
-class TestPoissonAnalysis:
-    """Test Poisson distribution analysis"""
+        assert lawkit.law("benford", column) == reference_results("benford", FLOAT_DATA)
+        assert lawkit.law_batch(["benford"], column) == [reference_results("benford", FLOAT_DATA)]
 
-    def test_poisson_analysis(self):
-        data = [0, 1, 2, 1, 3, 0, 2, 1, 4, 2, 1, 0, 3, 2, 1, 5, 0, 2, 1, 3]
+    def test_rows_requires_2d_data(self):
+        with pytest.raises(ValueError):
+            lawkit.law("benford", SAMPLE_DATA, rows=True)
 
-        results = lawkit.law("poisson", data)
+    def test_buffer_refilled_in_place(self):
+        batches = [
+            [123.0, 234.0, 345.0, 156.0, 178.0, 189.0, 267.0, 289.0, 378.0],
+            [912.0, 823.0, 734.0, 645.0, 556.0, 467.0, 978.0, 889.0, 791.0],
+        ]
+        buffer = array("d", batches[0])
 
-        assert len(results) == 1
-        result = results[0]
-        assert result["type"] == "PoissonAnalysis"
-        assert "lambda" in result
-        assert "variance_ratio" in result
+        for batch in batches:
+            buffer[:] = array("d", batch)
+            assert lawkit.law("benford", buffer) == lawkit.law("benford", batch)
 
 
-class TestValidation:
-    """Test data validation"""
+class TestBenfordPMF:
+    """Test the precomputed Benford reference distribution"""
 
-    def test_validation(self):
-        data = [123, 234, 345, 456, 567, 678, 789, 890, 901]
+    def test_benford_pmf(self):
+        assert len(lawkit.BENFORD_PMF) == 9
+        assert lawkit.BENFORD_PMF[0] == pytest.approx(0.30103, abs=1e-5)
+        assert sum(lawkit.BENFORD_PMF) == pytest.approx(1.0)
 
-        results = lawkit.law("validate", data)
 
-        assert len(results) == 1
-        result = results[0]
-        assert result["type"] == "ValidationResult"
-        assert "validation_passed" in result
-        assert "data_quality_score" in result
+class TestNumPyInput:
+    """Test NumPy arrays passed through the buffer protocol"""
+
+    @pytest.mark.parametrize(
+        "dtype", ["float64", "float32", "int64", "int32", "int16", "uint64", "uint16"]
+    )
+    def test_ndarray(self, dtype):
+        np = pytest.importorskip("numpy")
+        values = np.asarray(FLOAT_DATA).astype(dtype)
+
+        results = lawkit.law("benford", values)
+
+        assert results == lawkit.law("benford", values.tolist())
+
+    def test_unsupported_dtype(self):
+        np = pytest.importorskip("numpy")
+
+        with pytest.raises(TypeError):
+            lawkit.law("benford", np.asarray(FLOAT_DATA, dtype=np.float16))
+
+    def test_unsupported_dtype_scalars(self):
+        np = pytest.importorskip("numpy")
+        data = [np.float16(1.5), 234.25, 345.0, 156.75, 178.0, 189.5, 267.0, 289.25, 378.0]
+
+        assert lawkit.law("benford", data) == lawkit.law("benford", [float(x) for x in data])
+        assert lawkit.first_digits([np.float16(1.5), np.longdouble(27.0)]) == [1, 2]
+        config = {"type": "benford", "count": 100, "seed": 12345}
+        assert lawkit.law("generate", config, show_details=np.True_) == lawkit.law(
+            "generate", config, show_details=True
+        )
+
+    def test_non_contiguous_ndarray(self):
+        np = pytest.importorskip("numpy")
+        values = np.asarray(FLOAT_DATA * 2, dtype=np.float64)[::2]
+
+        results = lawkit.law("benford", values)
+
+        assert results == lawkit.law("benford", values.tolist())
+
+    def test_stacked_ndarray(self):
+        np = pytest.importorskip("numpy")
+        batches = np.stack([np.asarray(FLOAT_DATA), np.asarray(FLOAT_DATA) * 3])
+
+        results = lawkit.law("benford", batches, rows=True)
+
+        assert results == [lawkit.law("benford", row) for row in batches.tolist()]
+
+    def test_column_ndarray(self):
+        np = pytest.importorskip("numpy")
+        column = np.asarray(FLOAT_DATA).reshape(-1, 1)
+
+        assert lawkit.law("benford", column) == lawkit.law("benford", column.ravel().tolist())
+
+
+class TestFromString:
+    """Test analysis of CSV content"""
+
+    def test_law_from_string(self):
+        content = "amount\n123.45\n234.5, 345.0\n\nn/a\n456.75\n\"567.25\"\n"
+
+        results = lawkit.law_from_string(content, "benford")
+
+        assert results == lawkit.law("benford", [123.45, 234.5, 345.0, 456.75, 567.25])
+
+    def test_law_from_string_quoted_thousands_separator(self):
+        content = 'amount,note\n"1,234.56",a\n"2,345",b\n356.5,"c, d"\n'
+
+        results = lawkit.law_from_string(content, "benford")
+
+        assert results == lawkit.law("benford", [1234.56, 2345.0, 356.5])
+
+    def test_law_from_string_json(self):
+        results = lawkit.law_from_string(json.dumps(SAMPLE_DATA), "benford", format="json")
+
+        assert results == reference_results("benford", SAMPLE_DATA)
+
+    def test_law_from_string_bin(self):
+        results = lawkit.law_from_string(FLOAT_BLOB, "benford", format="bin")
+
+        assert results == reference_results("benford", FLOAT_DATA)
+
+    def test_law_from_string_bin_memoryview(self):
+        results = lawkit.law_from_string(memoryview(FLOAT_BLOB), "benford", format="bin")
+
+        assert results == reference_results("benford", FLOAT_DATA)
+
+    def test_law_from_string_bin_truncated(self):
+        with pytest.raises(ValueError):
+            lawkit.law_from_string(b"\x00" * 7, "benford", format="bin")
+
+    def test_law_from_string_unknown_format(self):
+        with pytest.raises(ValueError):
+            lawkit.law_from_string("1,2,3", "benford", format="xml")
+
+    def test_law_from_file(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("value\n" + "\n".join(str(x) for x in FLOAT_DATA) + "\n")
+
+        results = lawkit.law_from_file(str(path), "validate")
+
+        assert results == reference_results("validate", FLOAT_DATA)
+
+    def test_law_from_file_json(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(SAMPLE_DATA))
+
+        results = lawkit.law_from_file(str(path), "benford")
+
+        assert results == reference_results("benford", SAMPLE_DATA)
+
+    def test_law_from_file_bin(self, tmp_path):
+        path = tmp_path / "data.dat"
+        path.write_bytes(FLOAT_BLOB)
+
+        results = lawkit.law_from_file(str(path), "benford", format="bin")
+
+        assert results == reference_results("benford", FLOAT_DATA)
+
+    def test_law_from_file_missing(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            lawkit.law_from_file(str(tmp_path / "missing.csv"), "benford")
+
+
+class TestFirstDigits:
+    """Test leading digit extraction"""
+
+    def test_first_digits(self):
+        assert lawkit.first_digits([123, 0.045, -9876, 7, 1e300]) == [1, 4, 9, 7, 1]
+
+    def test_first_digits_zero_and_non_finite(self):
+        assert lawkit.first_digits([0, 0.0, float("nan"), float("inf")]) == [0, 0, 0, 0]
+
+    def test_first_digits_buffer(self):
+        assert lawkit.first_digits(array("d", [0.3, 2.5, 999.0])) == [3, 2, 9]
+
+    @pytest.mark.skipif(sys.version_info < (3, 9), reason="math.nextafter requires Python 3.9")
+    def test_first_digits_near_digit_boundaries(self):
+        values = [
+            value
+            for exponent in range(-30, 30)
+            for digit in range(1, 10)
+            for value in (
+                math.nextafter(digit * 10.0**exponent, 0),
+                digit * 10.0**exponent,
+                math.nextafter(digit * 10.0**exponent, math.inf),
+            )
+        ] + [5e-324, sys.float_info.max, 4999999999999999.0, 0.1 + 0.2]
+        expected = [int(next(c for c in repr(value) if c in "123456789")) for value in values]
+
+        assert lawkit.first_digits(values) == expected
+
+    def test_first_digits_large_integers(self):
+        values = [19999999999999999, -29999999999999999, 2**64 - 1, -(2**63)]
+
+        assert lawkit.first_digits(values) == [1, 2, 1, 9]
+        assert lawkit.first_digits(array("q", values[1:2] + values[3:])) == [2, 9]
+
+    def test_first_digits_rejects_strings(self):
+        with pytest.raises(ValueError):
+            lawkit.first_digits(["abc"])
 
 
 class TestOptions:
     """Test option handling"""
 
     def test_confidence_level_option(self):
-        data = [123, 234, 345, 456, 567, 678, 789, 890, 901]
-
-        results = lawkit.law("benford", data, confidence_level=0.99)
+        results = lawkit.law("benford", list(SAMPLE_DATA), confidence_level=0.99)
 
         assert len(results) == 1
 
     def test_risk_threshold_option(self):
-        data = [123, 234, 345, 456, 567, 678, 789, 890, 901]
+        results = lawkit.law("benford", list(SAMPLE_DATA), risk_threshold="high")
+
+        assert len(results) == 1
+
+    def test_ignore_keys_regex_option_repeated(self):
+        first = lawkit.law("benford", list(SAMPLE_DATA), ignore_keys_regex="^id$")
+        second = lawkit.law("benford", list(SAMPLE_DATA), ignore_keys_regex="^id$")
+
+        assert first == second
+
+    def test_invalid_regex_option(self):
+        with pytest.raises(ValueError):
+            lawkit.law("benford", list(SAMPLE_DATA), ignore_keys_regex="(")
+
+    def test_reused_options_object(self):
+        options = lawkit.Options(risk_threshold="high", confidence_level=0.99)
+        expected = lawkit.law("benford", list(SAMPLE_DATA), risk_threshold="high", confidence_level=0.99)
+
+        for _ in range(3):
+            assert lawkit.law("benford", list(SAMPLE_DATA), options=options) == expected
+        assert lawkit.law_batch(["benford"], list(SAMPLE_DATA), options=options) == [expected]
+
+    def test_options_and_kwargs_conflict(self):
+        options = lawkit.Options(risk_threshold="high")
+
+        with pytest.raises(TypeError):
+            lawkit.law("benford", list(SAMPLE_DATA), options=options, confidence_level=0.99)
+
+    def test_options_invalid_regex(self):
+        with pytest.raises(ValueError):
+            lawkit.Options(ignore_keys_regex="(")
+
+
+class TestConcurrency:
+    """Test calling law() from multiple threads"""
+
+    def test_concurrent_analysis(self):
+        datasets = [
+            [123, 234, 345, 156, 178, 189, 267, 289, 378],
+            [412, 523, 634, 745, 856, 967, 1234, 2345, 3456],
+            [1000, 500, 333, 250, 200, 167, 143, 125, 111],
+        ]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda data: lawkit.law("benford", data), datasets))
+
+        assert results == [lawkit.law("benford", data) for data in datasets]
+
+    def test_concurrent_file_analysis(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"data{i}.csv"
+            path.write_text("\n".join(str(x * (i + 1)) for x in SAMPLE_DATA))
+            paths.append(str(path))
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(lambda path: lawkit.law_from_file(path, "benford"), paths))
+
+        assert results == [lawkit.law_from_file(path, "benford") for path in paths]
+
+
+class TestPerformance:
+    """Benchmark analysis of large datasets"""
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        importlib.util.find_spec("pytest_benchmark") is None, reason="pytest-benchmark not installed"
+    )
+    def test_large_dataset_benchmark(self, benchmark):
+        data = array("d", range(1, 10_001))
 
-        results = lawkit.law("benford", data, risk_threshold="high")
+        results = benchmark(lawkit.law, "validate", data)
 
         assert len(results) == 1
+        assert results[0]["type"] == "ValidationResult"
 
 
 class TestErrorHandling: